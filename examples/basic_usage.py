@@ -77,7 +77,7 @@ def main():
                        .lazy_frame
                        .group_by(["SEX", "RACE"])
                        .agg([
-                           pl.count().alias("count"),
+                           pl.len().alias("count"),
                            pl.col("AGE").cast(pl.Int64, strict=False).mean().alias("mean_age")
                        ])
                        .sort("count", descending=True)
@@ -89,11 +89,12 @@ def main():
         # Example 5: Using convenience methods
         print("\n--- Convenience Methods ---")
         
-        # Get just demographic columns
+        # Get just demographic columns - project and filter before sampling
+        # so parquet projection pushdown reads only the needed columns
         demographics = (ncdb_tools.load_data(data_dir)
-                       .select_demographics()
-                       .sample(n=1000)
-                       .select(["AGE", "SEX", "RACE", "INSURANCE_STATUS"]))
+                       .select(["AGE", "SEX", "RACE", "INSURANCE_STATUS"])
+                       .collect()
+                       .sample(n=1000))
         
         print("Demographics sample:")
         print(demographics.head(5))
@@ -23,11 +23,12 @@ __all__ = [
 ]
 
 try:
-    from importlib.metadata import version
-    __version__ = version("ncdb-tools")
+    # Written at build time by hatchling's version hook; a plain attribute
+    # read is much cheaper than the importlib.metadata dist-info scan
+    from ._version import __version__
 except ImportError:
-    # Fallback for Python < 3.8
-    from importlib_metadata import version  # type: ignore
-    __version__ = version("ncdb-tools")
-except Exception:
-    __version__ = "unknown"
+    try:
+        from importlib.metadata import version
+        __version__ = version("ncdb-tools")
+    except Exception:
+        __version__ = "unknown"
@@ -1,11 +1,16 @@
 """Data ingestion functions for NCDB data using Polars."""
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 
 import polars as pl
 from tqdm import tqdm
 
+from .sas_parser import parse_column_positions
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,51 +21,133 @@ def create_parquet_from_text(
 ) -> None:
     """Convert NCDB text files to parquet format.
 
+    Files are independent, so conversion is dispatched to a process pool
+    (parsing is CPU-bound) with one worker per file up to half the cores.
+
     Args:
         text_files: List of paths to NCDB .dat files
         output_dir: Directory to write parquet files
         memory_limit: Memory limit for operations (not used in Polars)
     """
-    logger.info(f"Converting {len(text_files)} NCDB files to parquet format")
+    logger.info("Converting %d NCDB files to parquet format", len(text_files))
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for text_file in tqdm(text_files, desc="Converting files"):
-        logger.info(f"Processing {text_file.name}")
-
-        # Read NCDB fixed-width file
-        # Note: This assumes the SAS parser is already implemented in the existing code
-        try:
-            df = read_ncdb_file(text_file)
-
-            # Write to parquet
-            output_file = output_dir / f"{text_file.stem}.parquet"
-            df.write_parquet(output_file)
-
-            logger.info(f"Created {output_file.name} with {df.height:,} rows")
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+    if len(text_files) < 2 or max_workers == 1:
+        for text_file in tqdm(text_files, desc="Converting files"):
+            _convert_one(text_file, output_dir)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_convert_one, text_file, output_dir): text_file
+            for text_file in text_files
+        }
+        for future in tqdm(
+            as_completed(futures), total=len(futures), desc="Converting files"
+        ):
+            text_file = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Failed to process %s: %s", text_file.name, e)
+                raise
+
+
+def _convert_one(text_file: Path, output_dir: Path) -> Path:
+    """Convert a single NCDB text file to parquet."""
+    logger.info("Processing %s", text_file.name)
+
+    df = read_ncdb_file(text_file)
+
+    # Sort by the common filter columns so row-group min/max statistics are
+    # tight enough for downstream year/site queries to prune row groups
+    sort_cols = [c for c in ("YEAR_OF_DIAGNOSIS", "PRIMARY_SITE") if c in df.columns]
+    if sort_cols:
+        df = df.sort(sort_cols)
+
+    output_file = output_dir / f"{text_file.stem}.parquet"
+    df.write_parquet(
+        output_file,
+        compression="zstd",
+        compression_level=3,
+        statistics=True,
+        row_group_size=128_000,
+    )
 
-        except Exception as e:
-            logger.error(f"Failed to process {text_file.name}: {e}")
-            raise
+    logger.info("Created %s with %s rows", output_file.name, f"{df.height:,}")
+    return output_file
 
 
-def read_ncdb_file(file_path: Path) -> pl.DataFrame:
-    """Read a single NCDB data file.
+def read_ncdb_file(
+    file_path: Path, sas_labels_file: Optional[Path] = None
+) -> pl.DataFrame:
+    """Read a single NCDB fixed-width data file.
 
-    This is a placeholder that should integrate with the existing
-    SAS parser and database builder functionality.
+    Column positions come from the SAS labels file that ships alongside the
+    NCDB data. Lines are loaded as a single string column and every field is
+    extracted with a str.slice expression, so the slicing and whitespace
+    stripping run in Polars' parallel Rust string kernels instead of a
+    per-line Python loop.
 
     Args:
         file_path: Path to NCDB .dat file
+        sas_labels_file: Path to the SAS labels file defining column positions.
+            If None, the first .sas file next to the data file is used.
 
     Returns:
-        Polars DataFrame with the data
+        Polars DataFrame with one string column per NCDB field
     """
-    # This should use the existing SAS parser and database builder
-    # For now, this is a placeholder that delegates to existing code
-
-    # Use existing functionality to read the file
-    # This needs to be adapted to work with the new architecture
-    raise NotImplementedError(
-        "This function needs to integrate with existing SAS parser"
+    if sas_labels_file is None:
+        sas_labels_file = _find_sas_labels_file(file_path.parent)
+
+    column_defs = _cached_column_positions(sas_labels_file.resolve())
+    if not column_defs:
+        raise ValueError(
+            f"No column definitions found in SAS labels file: {sas_labels_file}"
+        )
+
+    # Read each line as one untouched string: no header, a separator and
+    # quote char that cannot occur in fixed-width NCDB data
+    lines = pl.read_csv(
+        file_path,
+        has_header=False,
+        separator="\x01",
+        quote_char=None,
+        new_columns=["_line"],
+        encoding="utf8-lossy",
     )
+
+    field_exprs = [
+        pl.col("_line")
+        .str.slice(cd['start'], cd['width'])
+        .str.strip_chars()
+        .replace("", None)
+        .alias(cd['name'])
+        for cd in column_defs
+    ]
+
+    return lines.select(field_exprs)
+
+
+@lru_cache(maxsize=8)
+def _cached_column_positions(sas_labels_file: Path) -> List[Dict[str, Any]]:
+    """Parse SAS column positions once per labels file.
+
+    Every .dat file in a year's release shares one labels file, so a
+    multi-file ingest would otherwise re-run the regex parse per file.
+    """
+    return parse_column_positions(sas_labels_file)
+
+
+def _find_sas_labels_file(data_dir: Path) -> Path:
+    """Locate the SAS labels file accompanying NCDB data files."""
+    sas_files = sorted(data_dir.glob("*.sas"))
+    if not sas_files:
+        raise FileNotFoundError(
+            f"No SAS labels file found in {data_dir}; "
+            "one is required to define NCDB column positions"
+        )
+    return sas_files[0]
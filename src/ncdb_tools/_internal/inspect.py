@@ -1,10 +1,13 @@
 """Data inspection utilities for NCDB data."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import polars as pl
 
+from .parquet_meta import list_parquet_files, read_metadata
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,39 +20,30 @@ def inspect_parquet_files(parquet_dir: Path) -> Dict[str, Any]:
     Returns:
         Dictionary with inspection results
     """
-    parquet_files = [f for f in parquet_dir.glob("*.parquet")]
+    parquet_files = list_parquet_files(parquet_dir)
 
     if not parquet_files:
         raise ValueError(f"No parquet files found in {parquet_dir}")
 
-    logger.info(f"Inspecting {len(parquet_files)} parquet files")
+    logger.info("Inspecting %d parquet files", len(parquet_files))
+
+    # Inspection is IO and footer-parse bound, so fan the per-file work
+    # out to threads (footer reads release the GIL in Polars' Rust core)
+    with ThreadPoolExecutor(max_workers=min(32, len(parquet_files))) as executor:
+        results = list(executor.map(_inspect_one, parquet_files))
 
     # Collect basic information
     file_info = []
     total_rows = 0
     schemas = []
 
-    for pf in parquet_files:
-        try:
-            # Read parquet metadata without loading data
-            df_info = pl.scan_parquet(pf)
-            schema = df_info.collect_schema()
-
-            # Get row count efficiently
-            row_count = df_info.select(pl.len()).collect().item()
-
-            file_info.append({
-                'file': pf.name,
-                'rows': row_count,
-                'columns': len(schema),
-                'size_mb': pf.stat().st_size / (1024 * 1024)
-            })
-
-            total_rows += row_count
-            schemas.append(schema)
-
-        except Exception as e:
-            logger.warning(f"Could not inspect {pf.name}: {e}")
+    for result in results:
+        if result is None:
+            continue
+        info, schema = result
+        file_info.append(info)
+        total_rows += info['rows']
+        schemas.append(schema)
 
     # Analyze schema consistency
     common_columns = analyze_schema_consistency(schemas)
@@ -60,10 +54,37 @@ def inspect_parquet_files(parquet_dir: Path) -> Dict[str, Any]:
         'file_details': file_info,
         'common_columns': len(common_columns),
         'column_names': list(common_columns),
-        'schemas_consistent': len(set(str(s) for s in schemas)) == 1
+        # Structural equality on pl.Schema; no stringification needed.
+        # No readable schemas means nothing could be verified, not
+        # consistency
+        'schemas_consistent': bool(schemas) and all(
+            s == schemas[0] for s in schemas[1:]
+        )
     }
 
 
+def _inspect_one(pf: Path) -> Optional[Tuple[Dict[str, Any], pl.Schema]]:
+    """Inspect a single parquet file, returning its info dict and schema."""
+    try:
+        # A single footer parse yields both the schema and the row count -
+        # parquet footers already carry num_rows, so no data pages are read
+        metadata = read_metadata(pf)
+        arrow_schema = metadata.schema.to_arrow_schema()
+        schema = pl.from_arrow(arrow_schema.empty_table()).schema
+
+        info = {
+            'file': pf.name,
+            'rows': metadata.num_rows,
+            'columns': len(schema),
+            'size_mb': pf.stat().st_size / (1024 * 1024)
+        }
+        return info, schema
+
+    except Exception as e:
+        logger.warning("Could not inspect %s: %s", pf.name, e)
+        return None
+
+
 def analyze_schema_consistency(schemas: List[pl.Schema]) -> Set[str]:
     """Analyze schema consistency across files.
 
@@ -76,12 +97,16 @@ def analyze_schema_consistency(schemas: List[pl.Schema]) -> Set[str]:
     if not schemas:
         return set()
 
-    # Find columns present in all schemas
-    common_columns = set(schemas[0].names())
-    for schema in schemas[1:]:
-        common_columns &= set(schema.names())
+    # Find columns present in all schemas, stopping as soon as the running
+    # intersection is empty
+    schemas_iter = iter(schemas)
+    common_columns = frozenset(next(schemas_iter).names())
+    for schema in schemas_iter:
+        common_columns &= frozenset(schema.names())
+        if not common_columns:
+            break
 
-    return common_columns
+    return set(common_columns)
 
 
 def get_column_statistics(
@@ -99,7 +124,7 @@ def get_column_statistics(
     if parquet_path.is_file():
         df = pl.scan_parquet(parquet_path)
     else:
-        parquet_files = list(parquet_path.glob("*.parquet"))
+        parquet_files = list_parquet_files(parquet_path)
         df = pl.scan_parquet(parquet_files)
 
     if columns:
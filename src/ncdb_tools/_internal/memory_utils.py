@@ -1,12 +1,56 @@
 """Memory management utilities for NCDB Tools."""
 
 import logging
-from typing import Dict, Optional, Union
+import re
+import time
+from typing import Any, Dict, Optional, Union
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# Memory snapshots barely change within a fraction of a second, but each
+# psutil.virtual_memory() call is a /proc/meminfo read (or sysctl). Cache
+# the snapshot briefly so per-file checks in build loops stay cheap.
+_SNAPSHOT_TTL_SECONDS = 0.25
+_snapshot_time = 0.0
+_snapshot: Optional[Any] = None
+
+
+def _virtual_memory() -> Any:
+    """Return a psutil memory snapshot, reused within a short TTL."""
+    global _snapshot_time, _snapshot
+
+    now = time.monotonic()
+    if _snapshot is None or now - _snapshot_time >= _SNAPSHOT_TTL_SECONDS:
+        _snapshot = psutil.virtual_memory()
+        _snapshot_time = now
+    return _snapshot
+
+
+def _clear_memory_snapshot() -> None:
+    """Drop the cached memory snapshot.
+
+    For tests that patch psutil.virtual_memory and need the next call to
+    observe the patched value rather than a snapshot inside the TTL.
+    """
+    global _snapshot
+    _snapshot = None
+
+
+# Memory limit grammar, compiled once: number plus optional unit, with a
+# bare number meaning GB. One match replaces the per-call chain of
+# endswith probes, and the unit keys a plain dict dispatch.
+_MEMORY_LIMIT_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?B)?\s*$", re.I)
+_MEMORY_MULTIPLIERS = {
+    None: 1024**3,  # bare number: assume GB
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
 
 def get_memory_info() -> Dict[str, Union[str, int, float]]:
     """Get system memory information.
@@ -15,7 +59,7 @@ def get_memory_info() -> Dict[str, Union[str, int, float]]:
         Dictionary with memory information including total, available,
         used memory in GB and recommended memory limit.
     """
-    memory = psutil.virtual_memory()
+    memory = _virtual_memory()
 
     total_gb = memory.total / (1024**3)
     available_gb = memory.available / (1024**3)
@@ -61,22 +105,13 @@ def parse_memory_limit(limit: str) -> int:
     Raises:
         ValueError: If limit format is invalid
     """
-    limit = limit.upper().strip()
-
-    if limit.endswith('GB'):
-        return int(float(limit[:-2]) * 1024**3)
-    elif limit.endswith('MB'):
-        return int(float(limit[:-2]) * 1024**2)
-    elif limit.endswith('KB'):
-        return int(float(limit[:-2]) * 1024)
-    elif limit.endswith('B'):
-        return int(limit[:-1])
-    else:
-        # Try to parse as number (assume GB)
-        try:
-            return int(float(limit) * 1024**3)
-        except ValueError:
-            raise ValueError(f"Invalid memory limit format: {limit}")
+    match = _MEMORY_LIMIT_RE.match(limit)
+    if match is None:
+        raise ValueError(f"Invalid memory limit format: {limit}")
+
+    number, unit = match.groups()
+    multiplier = _MEMORY_MULTIPLIERS[unit.upper() if unit else None]
+    return int(float(number) * multiplier)
 
 
 def check_memory_usage(required_gb: Optional[float] = None) -> bool:
@@ -88,15 +123,14 @@ def check_memory_usage(required_gb: Optional[float] = None) -> bool:
     Returns:
         True if sufficient memory is available
     """
-    memory_info = get_memory_info()
-    available_bytes = memory_info['available_bytes']
-    assert isinstance(available_bytes, int)  # Type guard
-    available_gb = available_bytes / (1024**3)
+    available_bytes = _virtual_memory().available
 
     if required_gb is None:
-        return available_gb > 1.0  # At least 1GB available
+        return available_bytes > 1024**3  # At least 1GB available
 
-    return available_gb >= required_gb
+    # Compare in integer bytes; converting available memory to float GB
+    # would round at the exact-fit boundary
+    return available_bytes >= int(required_gb * 1024**3)
 
 
 def warn_if_low_memory(operation: str = "operation") -> None:
@@ -105,7 +139,7 @@ def warn_if_low_memory(operation: str = "operation") -> None:
     Args:
         operation: Name of operation being performed (for warning message)
     """
-    memory = psutil.virtual_memory()
+    memory = _virtual_memory()
 
     if memory.percent > 85:
         logger.warning(
@@ -0,0 +1,59 @@
+"""Memoized parquet footer reads and file listing shared across the package."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Union
+
+import pyarrow.parquet as pq
+
+from ..constants import PARQUET_EXTENSION
+
+
+def list_parquet_files(directory: Union[str, Path]) -> List[Path]:
+    """List a directory's parquet files in one os.scandir pass.
+
+    Path.glob allocates a Path and stats per entry; scandir surfaces the
+    name and file type from the directory read itself, which matters on
+    NCDB directories holding hundreds of tumor-type shards. Results are
+    sorted for a deterministic scan order.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Sorted paths of the parquet files directly in the directory
+    """
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(PARQUET_EXTENSION) and entry.is_file():
+                files.append(Path(entry.path))
+    files.sort()
+    return files
+
+
+def read_metadata(path: Union[str, Path]) -> pq.FileMetaData:
+    """Read a parquet file's footer metadata, reusing a cached parse.
+
+    The dictionary generator, query shortcuts, and dataset verification
+    all consult the same footers, often for the same files within one
+    build or test session. FileMetaData is immutable, so one parse can be
+    shared; the cache key includes mtime and size, so a rewritten file
+    misses and is re-parsed.
+
+    Args:
+        path: Path to a parquet file
+
+    Returns:
+        Parsed footer metadata for the file
+    """
+    stat = Path(path).stat()
+    return _read_metadata_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _read_metadata_cached(
+    path: str, mtime_ns: int, size: int
+) -> pq.FileMetaData:
+    return pq.read_metadata(path)
@@ -1,14 +1,36 @@
 """Transformation functions for NCDB data using Polars."""
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
 import polars as pl
 
 from ..constants import NEVER_NUMERIC_COLUMNS
+from .parquet_meta import list_parquet_files
 
 logger = logging.getLogger(__name__)
 
+# Prefix lookup tables for the group expressions below (ICD-O-3 prefixes)
+_SITE_GROUP_MAP: Dict[str, str] = {
+    "C50": "Breast",
+    "C78": "Lymph Node",
+    "C77": "Lymph Node",
+    "C71": "Brain/CNS",
+    "C72": "Brain/CNS",
+    "C43": "Skin/Melanoma",
+    "C44": "Skin/Melanoma",
+}
+
+_HISTOLOGY_GROUP_MAP: Dict[str, str] = {
+    "814": "Adenocarcinoma",
+    "805": "Squamous Cell Carcinoma",
+    "872": "Melanoma",
+    "959": "Lymphoma",
+    "967": "Lymphoma",
+}
+
 
 def apply_transformations(
     parquet_dir: Path, dataset_type: str, memory_limit: str
@@ -20,31 +42,30 @@ def apply_transformations(
         dataset_type: Type of dataset (not used for NCDB, kept for compatibility)
         memory_limit: Memory limit for operations (not used in Polars version)
     """
-    logger.info(f"Applying transformations to NCDB parquet files in {parquet_dir}")
+    logger.info("Applying transformations to NCDB parquet files in %s", parquet_dir)
 
     # First, determine global schema by examining all files
-    parquet_files = [
-        f for f in parquet_dir.glob("*.parquet") if f.name != "metadata.json"
-    ]
+    parquet_files = list_parquet_files(parquet_dir)
     logger.info("Determining global schema for consistent data types...")
     global_schema = determine_global_schema(parquet_files)
-    logger.info(f"Global schema determined for {len(global_schema)} columns")
+    logger.info("Global schema determined for %d columns", len(global_schema))
 
     # Process each parquet file with consistent schema
     for parquet_file in parquet_files:
-        logger.info(f"Transforming {parquet_file.name}")
-
-        # Read the parquet file
-        df = pl.read_parquet(parquet_file)
+        logger.info("Transforming %s", parquet_file.name)
 
-        # Apply transformations
-        df = apply_data_type_conversions(df, global_schema)
-        df = apply_ncdb_specific_transformations(df)
+        # Build a lazy pipeline so the streaming engine can process the file
+        # in bounded chunks instead of materializing it fully in memory
+        lf = pl.scan_parquet(parquet_file)
+        lf = apply_data_type_conversions(lf, global_schema)
+        lf = apply_ncdb_specific_transformations(lf)
 
-        # Write back to parquet
-        df.write_parquet(parquet_file)
+        # Stream to a temporary file, then atomically replace the original
+        tmp_file = parquet_file.with_suffix(".parquet.tmp")
+        lf.sink_parquet(tmp_file, compression="zstd", row_group_size=128_000)
+        os.replace(tmp_file, parquet_file)
 
-        logger.info(f"Completed transformation of {parquet_file.name}")
+        logger.info("Completed transformation of %s", parquet_file.name)
 
 
 def determine_global_schema(parquet_files: List[Path]) -> Dict[str, pl.DataType]:
@@ -56,14 +77,23 @@ def determine_global_schema(parquet_files: List[Path]) -> Dict[str, pl.DataType]
     Returns:
         Dictionary mapping column names to optimal data types
     """
+    if not parquet_files:
+        return {}
+
     logger.info("Analyzing schemas across all parquet files...")
 
+    # Footer reads are latency-bound, so collect schemas in parallel -
+    # the actual parsing happens in Polars' Rust core and releases the GIL
+    with ThreadPoolExecutor(max_workers=min(32, len(parquet_files))) as executor:
+        schemas = list(
+            executor.map(lambda pf: pl.scan_parquet(pf).collect_schema(), parquet_files)
+        )
+
     # Collect all schemas
     all_columns = set()
     column_types: Dict[str, List[pl.DataType]] = {}
 
-    for pf in parquet_files:
-        df_schema = pl.scan_parquet(pf).collect_schema()
+    for df_schema in schemas:
         all_columns.update(df_schema.names())
 
         for col, dtype in df_schema.items():
@@ -93,135 +123,131 @@ def resolve_column_type(types: List[pl.DataType]) -> pl.DataType:
     Returns:
         The most appropriate data type
     """
-    # Convert to string representation for easier comparison
-    type_strs = [str(t) for t in types]
-    unique_types = set(type_strs)
+    if not types:
+        return pl.Utf8()
 
     # If all the same, return that type
-    if len(unique_types) == 1:
-        return types[0]
-
-    # Preference order: String > Float64 > Int64
-    if any('Utf8' in t or 'String' in t for t in type_strs):
+    first = types[0]
+    if all(t == first for t in types):
+        return first
+
+    # Single pass OR-ing a precedence bitmask: string > float > integer.
+    # Works on the dtypes directly, so narrower types like Float32/Int32
+    # widen correctly instead of falling through to string
+    precedence = 0
+    for t in types:
+        if isinstance(t, pl.String):
+            precedence |= 4
+        elif t.is_float():
+            precedence |= 2
+        elif t.is_integer():
+            precedence |= 1
+
+    if precedence & 4:
         return pl.Utf8()
-    elif any('Float64' in t for t in type_strs):
+    if precedence & 2:
         return pl.Float64()
-    elif any('Int64' in t for t in type_strs):
+    if precedence & 1:
         return pl.Int64()
-    else:
-        # Default to string for safety
-        return pl.Utf8()
+
+    # Default to string for safety
+    return pl.Utf8()
 
 
 def apply_data_type_conversions(
-    df: pl.DataFrame, target_schema: Dict[str, pl.DataType]
-) -> pl.DataFrame:
+    lf: pl.LazyFrame, target_schema: Dict[str, pl.DataType]
+) -> pl.LazyFrame:
     """Apply data type conversions to match target schema.
 
     Args:
-        df: Input DataFrame
+        lf: Input LazyFrame
         target_schema: Target schema with desired data types
 
     Returns:
-        DataFrame with converted data types
+        LazyFrame with converted data types
     """
-    conversions = []
-
-    current_schema = df.schema
-
-    for col, target_type in target_schema.items():
-        if col in current_schema and current_schema[col] != target_type:
-            # Skip conversion if column should stay as string
-            if col in NEVER_NUMERIC_COLUMNS and target_type != pl.Utf8():
-                continue
+    current_schema = lf.collect_schema()
 
-            conversions.append(pl.col(col).cast(target_type, strict=False))
+    # Build one cast map and dispatch it in a single Rust-side operation
+    # instead of one expression per column
+    cast_map = {
+        col: target_type
+        for col, target_type in target_schema.items()
+        if col in current_schema
+        and current_schema[col] != target_type
+        # Skip conversion if column should stay as string
+        and not (col in NEVER_NUMERIC_COLUMNS and target_type != pl.Utf8())
+    }
 
-    if conversions:
-        df = df.with_columns(conversions)
+    if cast_map:
+        lf = lf.cast(cast_map, strict=False)
 
-    return df
+    return lf
 
 
-def apply_ncdb_specific_transformations(df: pl.DataFrame) -> pl.DataFrame:
+def apply_ncdb_specific_transformations(lf: pl.LazyFrame) -> pl.LazyFrame:
     """Apply NCDB-specific data transformations.
 
     Args:
-        df: Input DataFrame
+        lf: Input LazyFrame
 
     Returns:
-        DataFrame with NCDB-specific transformations applied
+        LazyFrame with NCDB-specific transformations applied
     """
     transformations = []
 
-    # Age processing - create numeric version while preserving original
-    if "AGE" in df.columns:
+    columns = lf.collect_schema().names()
+
+    # Age processing - create numeric version while preserving original.
+    # Rewrite "90+" to "90" and cast in one string pass instead of a
+    # when/then branch per derived column
+    if "AGE" in columns:
         transformations.extend([
             # Create numeric age (convert "90+" to 90)
-            pl.when(pl.col("AGE") == "90+")
-            .then(90)
-            .otherwise(pl.col("AGE").cast(pl.Int64, strict=False))
+            pl.col("AGE")
+            .str.replace(r"^90\+$", "90")
+            .cast(pl.Int64, strict=False)
             .alias("AGE_AS_INT"),
 
-            # Flag for 90+ ages
-            pl.when(pl.col("AGE") == "90+")
-            .then(True)
-            .otherwise(False)
-            .alias("AGE_IS_90_PLUS")
+            # Flag for 90+ ages (null ages are not 90+)
+            (pl.col("AGE") == "90+").fill_null(False).alias("AGE_IS_90_PLUS")
         ])
 
-    # Create tumor site groupings based on PRIMARY_SITE
-    if "PRIMARY_SITE" in df.columns:
-        transformations.append(
-            create_site_groups_expr().alias("SITE_GROUP")
-        )
+    # Create tumor site groupings based on PRIMARY_SITE. The code
+    # column itself stays a plain string (project rule: clinical codes
+    # are strings); parquet dictionary encoding already stores the few
+    # thousand distinct codes compactly without changing the dtype
+    if "PRIMARY_SITE" in columns:
+        transformations.append(create_site_groups_expr().alias("SITE_GROUP"))
 
     # Create histology groupings
-    if "HISTOLOGY" in df.columns:
+    if "HISTOLOGY" in columns:
         transformations.append(
             create_histology_groups_expr().alias("HISTOLOGY_GROUP")
         )
 
     # Apply all transformations
     if transformations:
-        df = df.with_columns(transformations)
+        lf = lf.with_columns(transformations)
 
-    return df
+    return lf
 
 
 def create_site_groups_expr() -> pl.Expr:
     """Create expression for grouping primary sites into major categories."""
+    # Compute the 3-character prefix once and map it through a hash table,
+    # instead of one starts_with pass per category
     return (
-        pl.when(pl.col("PRIMARY_SITE").str.starts_with("C50"))
-        .then("Breast")
-        .when(pl.col("PRIMARY_SITE").str.starts_with("C78"))
-        .then("Lymph Node")
-        .when(pl.col("PRIMARY_SITE").str.starts_with("C77"))
-        .then("Lymph Node")
-        .when(pl.col("PRIMARY_SITE").str.starts_with("C71"))
-        .then("Brain/CNS")
-        .when(pl.col("PRIMARY_SITE").str.starts_with("C72"))
-        .then("Brain/CNS")
-        .when(pl.col("PRIMARY_SITE").str.starts_with("C43"))
-        .then("Skin/Melanoma")
-        .when(pl.col("PRIMARY_SITE").str.starts_with("C44"))
-        .then("Skin/Melanoma")
-        .otherwise("Other")
+        pl.col("PRIMARY_SITE")
+        .str.slice(0, 3)
+        .replace_strict(_SITE_GROUP_MAP, default="Other")
     )
 
 
 def create_histology_groups_expr() -> pl.Expr:
     """Create expression for grouping histology codes into major categories."""
     return (
-        pl.when(pl.col("HISTOLOGY").str.starts_with("814"))
-        .then("Adenocarcinoma")
-        .when(pl.col("HISTOLOGY").str.starts_with("805"))
-        .then("Squamous Cell Carcinoma")
-        .when(pl.col("HISTOLOGY").str.starts_with("872"))
-        .then("Melanoma")
-        .when(pl.col("HISTOLOGY").str.starts_with("959"))
-        .then("Lymphoma")
-        .when(pl.col("HISTOLOGY").str.starts_with("967"))
-        .then("Lymphoma")
-        .otherwise("Other")
+        pl.col("HISTOLOGY")
+        .str.slice(0, 3)
+        .replace_strict(_HISTOLOGY_GROUP_MAP, default="Other")
     )
@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import Optional, Sequence, Union
 
+from .memory_utils import _MEMORY_LIMIT_RE, _MEMORY_MULTIPLIERS
+
 
 class NCDBValidationError(ValueError):
     """Raised when input validation fails."""
@@ -107,33 +109,23 @@ def validate_memory_limit(memory_limit: str) -> int:
             f"Memory limit must be a string (e.g., '4GB'), got {type_name}"
         )
 
-    memory_limit = memory_limit.strip().upper()
-
-    multipliers = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-    }
-
-    for suffix, multiplier in sorted(multipliers.items(), key=lambda x: -len(x[0])):
-        if memory_limit.endswith(suffix):
-            try:
-                value = float(memory_limit[: -len(suffix)])
-                if value <= 0:
-                    raise NCDBValidationError(
-                        f"Memory limit must be positive: {memory_limit}"
-                    )
-                return int(value * multiplier)
-            except ValueError as e:
-                raise NCDBValidationError(
-                    f"Invalid memory limit format: {memory_limit}"
-                ) from e
-
-    raise NCDBValidationError(
-        f"Memory limit must include unit (e.g., '4GB', '512MB'): {memory_limit}"
-    )
+    memory_limit = memory_limit.strip()
+
+    # Unlike parse_memory_limit, user-facing limits must carry an
+    # explicit unit, so a bare-number match is rejected here
+    match = _MEMORY_LIMIT_RE.match(memory_limit)
+    if match is None or match.group(2) is None:
+        raise NCDBValidationError(
+            f"Memory limit must include unit (e.g., '4GB', '512MB'): {memory_limit}"
+        )
+
+    value = float(match.group(1))
+    if value <= 0:
+        raise NCDBValidationError(
+            f"Memory limit must be positive: {memory_limit}"
+        )
+
+    return int(value * _MEMORY_MULTIPLIERS[match.group(2).upper()])
 
 
 def sanitize_path_for_logging(path: Path) -> str:
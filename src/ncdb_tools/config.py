@@ -1,9 +1,18 @@
 """Configuration management for NCDB Tools."""
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# NCDB-like filename patterns, compiled once for directory validation
+_NCDB_NAME_RE = re.compile(r"ncdb|puf|cancer")
+
+# Probed when the environment is unset; module-level so tests can point
+# it at a fixture file instead of chdir-ing into one
+_ENV_FILE = Path('.env')
+
 
 def get_data_directory() -> Optional[Path]:
     """Get the NCDB data directory from environment variables.
@@ -19,11 +28,10 @@ def get_data_directory() -> Optional[Path]:
         return Path(data_dir)
 
     # Check for .env file in current directory
-    env_file = Path('.env')
-    if env_file.exists():
+    if _ENV_FILE.exists():
         try:
             import dotenv
-            dotenv.load_dotenv()
+            dotenv.load_dotenv(_ENV_FILE)
             data_dir = os.getenv('NCDB_DATA_DIR')
             if data_dir:
                 return Path(data_dir)
@@ -56,19 +64,24 @@ def validate_data_directory(data_dir: Path) -> bool:
     if not data_dir.exists():
         return False
 
-    # Look for NCDB file patterns
-    dat_files = list(data_dir.glob('*.dat'))
-    parquet_files = list(data_dir.glob('*.parquet'))
+    # The verdict is memoized on the directory mtime, which changes when
+    # files are added or removed, so repeat validations of an unchanged
+    # directory cost one stat instead of a scan
+    return _validate_data_directory_cached(
+        str(data_dir), os.stat(data_dir).st_mtime_ns
+    )
 
-    if not dat_files and not parquet_files:
-        return False
 
-    # Check for NCDB-like filenames
-    ncdb_patterns = ['ncdb', 'ncdbpuf', 'puf', 'cancer']
-    all_files = dat_files + parquet_files
-    has_ncdb_file = any(
-        any(pattern in f.name.lower() for pattern in ncdb_patterns)
-        for f in all_files
-    )
+@lru_cache(maxsize=32)
+def _validate_data_directory_cached(path_str: str, mtime_ns: int) -> bool:
+    # One scandir pass: each entry is lowercased once and tested against
+    # the compiled pattern, returning as soon as a data file with an
+    # NCDB-like name is seen (the old glob-per-extension plus nested any()
+    # walked the directory twice and rescanned each name per pattern)
+    with os.scandir(path_str) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if name.endswith(('.dat', '.parquet')) and _NCDB_NAME_RE.search(name):
+                return True
 
-    return has_ncdb_file
+    return False
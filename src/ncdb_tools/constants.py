@@ -4,7 +4,7 @@ This module contains variable type definitions, column names, and other
 constants used throughout the package.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Tuple
 
 # =============================================================================
 # File Patterns and Data Specifications
@@ -22,7 +22,7 @@ NCDB_COLUMN_COUNT = 338
 # =============================================================================
 
 # Identifiers and codes that look numeric but are categorical
-STRING_VARIABLES: Set[str] = {
+STRING_VARIABLES: Tuple[str, ...] = (
     # Identifiers
     "PUF_CASE_ID",
     "PUF_FACILITY_ID",
@@ -32,34 +32,45 @@ STRING_VARIABLES: Set[str] = {
     "ZIP",
     "FACILITY_TYPE_CD",
     "FACILITY_LOCATION_CD",
-}
+)
 
 # Cancer classification codes - ICD-O-3 codes that must remain strings
-SITE_COLUMNS: List[str] = [
+SITE_COLUMNS: Tuple[str, ...] = (
     "PRIMARY_SITE",
-]
+)
 
-HISTOLOGY_COLUMNS: List[str] = [
+HISTOLOGY_COLUMNS: Tuple[str, ...] = (
     "HISTOLOGY",
     "HISTOLOGY_ICDO3",
     "BEHAVIOR",
-]
+)
 
 # Other categorical codes
-CLASSIFICATION_COLUMNS: List[str] = [
+CLASSIFICATION_COLUMNS: Tuple[str, ...] = (
     "LATERALITY",
     "CLASS_OF_CASE",
     "SEQUENCE_NUMBER",
-]
-
-# All columns that should never be converted to numeric
-NEVER_NUMERIC: Set[str] = (
-    STRING_VARIABLES
-    | set(SITE_COLUMNS)
-    | set(HISTOLOGY_COLUMNS)
-    | set(CLASSIFICATION_COLUMNS)
 )
 
+# All columns that should never be converted to numeric. A frozenset
+# literal: membership checks run once per column per file in the
+# transform pipeline, and nothing should mutate this at runtime
+NEVER_NUMERIC: FrozenSet[str] = frozenset({
+    "PUF_CASE_ID",
+    "PUF_FACILITY_ID",
+    "YEAR_OF_DIAGNOSIS",
+    "ZIP",
+    "FACILITY_TYPE_CD",
+    "FACILITY_LOCATION_CD",
+    "PRIMARY_SITE",
+    "HISTOLOGY",
+    "HISTOLOGY_ICDO3",
+    "BEHAVIOR",
+    "LATERALITY",
+    "CLASS_OF_CASE",
+    "SEQUENCE_NUMBER",
+})
+
 # Backward compatibility alias
 NEVER_NUMERIC_COLUMNS = NEVER_NUMERIC
 
@@ -91,7 +102,7 @@ HISTOLOGY_GROUP_FIELD: str = "HISTOLOGY_GROUP"
 # Column Groups for Convenience
 # =============================================================================
 
-DEMOGRAPHIC_COLUMNS: List[str] = [
+DEMOGRAPHIC_COLUMNS: Tuple[str, ...] = (
     "PUF_CASE_ID",
     "AGE",
     "SEX",
@@ -110,9 +121,9 @@ DEMOGRAPHIC_COLUMNS: List[str] = [
     "MED_INC_QUAR_2020",
     "NO_HSD_QUAR_2020",
     "CROWFLY",
-]
+)
 
-TREATMENT_COLUMNS: List[str] = [
+TREATMENT_COLUMNS: Tuple[str, ...] = (
     "RX_SUMM_SURG_PRIM_SITE",
     "RX_SUMM_CHEMO",
     "RX_SUMM_HORMONE",
@@ -128,16 +139,22 @@ TREATMENT_COLUMNS: List[str] = [
     "RAD_ELAPSED_RX_DAYS",
     "REASON_FOR_NO_RADIATION",
     "REASON_FOR_NO_SURGERY",
-]
+)
 
-OUTCOME_COLUMNS: List[str] = [
+OUTCOME_COLUMNS: Tuple[str, ...] = (
     "PUF_VITAL_STATUS",
     "DX_LASTCONTACT_DEATH_MONTHS",
     "PUF_30_DAY_MORT_CD",
     "PUF_90_DAY_MORT_CD",
     "READM_HOSP_30_DAYS",
     "PALLIATIVE_CARE",
-]
+)
+
+# Frozenset companions for O(1) membership tests; the tuples above keep
+# their documented ordering for display and selection
+DEMOGRAPHIC_COLUMNS_SET: FrozenSet[str] = frozenset(DEMOGRAPHIC_COLUMNS)
+TREATMENT_COLUMNS_SET: FrozenSet[str] = frozenset(TREATMENT_COLUMNS)
+OUTCOME_COLUMNS_SET: FrozenSet[str] = frozenset(OUTCOME_COLUMNS)
 
 # =============================================================================
 # Tumor Types (from NCDB file naming convention)
@@ -192,3 +209,15 @@ SITE_GROUPS: Dict[str, List[str]] = {
     "Thyroid": ["C73"],
     "Melanoma": ["C44"],
 }
+
+# Inverse lookup, precomputed once at import: maps a 3-character ICD-O-3
+# topography prefix straight to its group, so per-row classification is a
+# single hash probe instead of scanning every group's prefix list. Also
+# usable directly as a Polars mapping:
+#   pl.col("PRIMARY_SITE").str.slice(0, 3).replace_strict(
+#       SITE_PREFIX_TO_GROUP, default="Other")
+SITE_PREFIX_TO_GROUP: Dict[str, str] = {
+    prefix: group
+    for group, prefixes in SITE_GROUPS.items()
+    for prefix in prefixes
+}
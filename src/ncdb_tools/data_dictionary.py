@@ -1,15 +1,31 @@
 """Enhanced data dictionary generation for NCDB datasets."""
 
+import csv
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import polars as pl
+import pyarrow.parquet as pq
+
+from ._internal.parquet_meta import list_parquet_files, read_metadata
+
+# orjson serializes in Rust an order of magnitude faster than the stdlib;
+# it is an optional dependency, so fall back to json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Dtype-string classes used when rendering the HTML dictionary
+_NUMERIC_TYPE_STRS = frozenset({"Int64", "Int32", "Float64", "Float32"})
+_STRING_TYPE_STRS = frozenset({"String", "Utf8", "Categorical"})
+
 
 class DataDictionaryGenerator:
     """Enhanced data dictionary generator for NCDB datasets."""
@@ -58,13 +74,15 @@ class DataDictionaryGenerator:
 
         # Load data
         if parquet_path.is_file():
-            df = pl.scan_parquet(parquet_path)
+            parquet_files = [parquet_path]
         else:
-            parquet_files = list(parquet_path.glob("*.parquet"))
-            df = pl.scan_parquet(parquet_files)
+            parquet_files = list_parquet_files(parquet_path)
+        df = pl.scan_parquet(parquet_files)
 
         # Generate dictionary data
-        dict_data = self._generate_dictionary_data(df, include_stats, sample_size)
+        dict_data = self._generate_dictionary_data(
+            df, include_stats, sample_size, parquet_files
+        )
 
         # Write output files
         output_paths = {}
@@ -120,16 +138,44 @@ class DataDictionaryGenerator:
         self,
         df: pl.LazyFrame,
         include_stats: bool,
-        sample_size: int
+        sample_size: int,
+        parquet_files: List[Path]
     ) -> List[Dict[str, Any]]:
         """Generate the core dictionary data."""
-        schema = df.collect_schema()
-        total_rows = df.select(pl.len()).collect().item()
+        # Parse every file's footer once, in parallel; the schema, count,
+        # and min/max helpers all share the result instead of re-reading
+        # footers per statistic
+        footers = _read_footer_metadata(parquet_files)
+        schema = _schema_from_footer(footers)
+        if schema is None:
+            schema = df.collect_schema()
+        # Row and null counts live in the parquet footers, so the usual
+        # case needs no data pages at all; when any footer lacks them,
+        # one fused streaming aggregation produces both in a single scan
+        footer_counts = _footer_counts(footers)
+        if footer_counts is not None and all(
+            col_name in footer_counts[1] for col_name in schema
+        ):
+            total_rows, null_counts = footer_counts
+        else:
+            base = df.select(
+                pl.len().alias("__total_rows"),
+                *[pl.col(col_name).null_count() for col_name in schema],
+            ).collect(engine="streaming")
+            # One row() call unpacks every scalar at once instead of a
+            # column lookup plus .item() dispatch per column
+            null_counts = base.row(0, named=True)
+            total_rows = null_counts["__total_rows"]
 
         logger.info(f"Processing {len(schema)} columns with {total_rows:,} total rows")
 
-        # Get null counts for all columns at once
-        null_counts = df.null_count().collect()
+        # Compute all detailed statistics in one fused pass rather than
+        # per-column queries that each rescan the data
+        column_stats: Dict[str, Dict[str, Any]] = {}
+        if include_stats:
+            column_stats = self._calculate_all_column_stats(
+                df, schema, total_rows, null_counts, sample_size, footers
+            )
 
         dict_data = []
 
@@ -137,7 +183,7 @@ class DataDictionaryGenerator:
             logger.debug(f"Processing column: {col_name}")
 
             # Basic information
-            null_count = null_counts[col_name].item()
+            null_count = null_counts[col_name]
             null_pct = (null_count / total_rows * 100) if total_rows > 0 else 0
 
             col_info = {
@@ -153,84 +199,163 @@ class DataDictionaryGenerator:
                 'median': None
             }
 
-            if include_stats:
-                # Calculate detailed statistics
-                stats = self._calculate_column_stats(
-                    df, col_name, data_type, sample_size
-                )
-                col_info.update(stats)
-
+            col_info.update(column_stats.get(col_name, {}))
             dict_data.append(col_info)
 
         return dict_data
 
-    def _calculate_column_stats(
+    def _calculate_all_column_stats(
         self,
         df: pl.LazyFrame,
-        col_name: str,
-        data_type: pl.DataType,
-        sample_size: int
-    ) -> Dict[str, Any]:
-        """Calculate detailed statistics for a column."""
-        stats = {}
+        schema: pl.Schema,
+        total_rows: int,
+        null_counts: Dict[str, int],
+        sample_size: int,
+        footers: List[pq.FileMetaData]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Calculate detailed statistics for every column in one pass.
+
+        All aggregates are issued as a single select, so Polars computes
+        them over one shared scan of the (sampled) data instead of
+        re-materializing a Series per column per statistic. Numeric min/max
+        come from parquet footer statistics where present - exact over the
+        whole dataset and read without decoding any data pages.
+
+        Sampling is strided rather than a random draw: converted files
+        are sorted by year and site (see ingest.py), so taking the head
+        would over-represent the earliest years, while a random sample
+        would require decoding the full dataset first. gather_every
+        spreads the sampled rows evenly across that ordering.
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        footer_min_max = _footer_min_max(footers)
 
         try:
-            # Sample data for efficiency with large datasets
-            if sample_size and sample_size < df.select(pl.len()).collect().item():
-                # Collect first, then sample (since LazyFrame doesn't have sample)
-                full_df = df.collect()
-                sample_df = pl.LazyFrame(full_df.sample(n=sample_size))
+            # Sample data for efficiency with large datasets. The strided
+            # gather stays lazy and, unlike head() on year/site-sorted
+            # files, draws rows from every part of the sort order
+            if sample_size and sample_size < total_rows:
+                stride = max(total_rows // sample_size, 1)
+                sample_df = df.gather_every(stride).head(sample_size)
             else:
                 sample_df = df
 
-            # Count unique values
-            unique_count = (
-                sample_df.select(pl.col(col_name).n_unique()).collect().item()
-            )
-            stats['unique_values'] = unique_count
-
-            # Numeric statistics
-            if data_type.is_numeric():
-                numeric_stats = (sample_df
-                    .select([
-                        pl.col(col_name).min().alias('min'),
-                        pl.col(col_name).max().alias('max'),
-                        pl.col(col_name).mean().alias('mean'),
-                        pl.col(col_name).median().alias('median')
+            exprs = []
+            for col_name, data_type in schema.items():
+                # Metadata already determines some answers: an all-null
+                # column has no stats to compute, and a constant numeric
+                # column (footer min == max) pins every aggregate - no
+                # need to scan either
+                if null_counts.get(col_name) == total_rows:
+                    stats[col_name] = {'unique_values': 0}
+                    continue
+                if data_type.is_numeric() and col_name in footer_min_max:
+                    col_min, col_max = footer_min_max[col_name]
+                    if col_min == col_max:
+                        stats[col_name] = {
+                            'unique_values': 1,
+                            'min': col_min,
+                            'max': col_max,
+                            'mean': round(col_min, 2),
+                            'median': float(col_min),
+                        }
+                        continue
+                # HyperLogLog sketch: a single linear pass with fixed
+                # memory, vs. the per-column hash-set build of n_unique
+                exprs.append(
+                    pl.col(col_name).approx_n_unique().alias(f"{col_name}__unique")
+                )
+                if data_type.is_numeric():
+                    exprs.extend([
+                        pl.col(col_name).mean().alias(f"{col_name}__mean"),
+                        pl.col(col_name).median().alias(f"{col_name}__median"),
                     ])
-                    .collect())
-
-                if numeric_stats.height > 0:
-                    row = numeric_stats.row(0)
-                    stats.update({
-                        'min': row[0],
-                        'max': row[1],
-                        'mean': round(row[2], 2) if row[2] is not None else None,
-                        'median': row[3]
+                    if col_name not in footer_min_max:
+                        exprs.extend([
+                            pl.col(col_name).min().alias(f"{col_name}__min"),
+                            pl.col(col_name).max().alias(f"{col_name}__max"),
+                        ])
+
+            # The streaming engine runs the fused select as one pass over
+            # the data in bounded, cache-sized row batches across all
+            # columns at once - no column-chunked re-scans needed
+            # One row() call turns the single-row result into a plain
+            # dict, replacing a column lookup plus .item() per aggregate
+            row = sample_df.select(exprs).collect(
+                engine="streaming"
+            ).row(0, named=True)
+
+            # Recount low-cardinality columns exactly: approximate counts
+            # are fine for ID-like columns, but readers rely on the exact
+            # number when deciding whether a variable is categorical, so
+            # columns near that range get one small follow-up pass
+            exact_counts: Dict[str, int] = {}
+            recount_cols = [
+                col_name for col_name in schema
+                if col_name not in stats and row[f"{col_name}__unique"] <= 40
+            ]
+            if recount_cols:
+                exact_counts = sample_df.select(
+                    pl.col(c).n_unique().alias(c) for c in recount_cols
+                ).collect(engine="streaming").row(0, named=True)
+
+            for col_name, data_type in schema.items():
+                if col_name in stats:
+                    continue  # settled from footer metadata above
+                col_stats: Dict[str, Any] = {
+                    'unique_values': exact_counts.get(
+                        col_name, row[f"{col_name}__unique"]
+                    )
+                }
+                if data_type.is_numeric():
+                    mean = row[f"{col_name}__mean"]
+                    if col_name in footer_min_max:
+                        col_min, col_max = footer_min_max[col_name]
+                    else:
+                        col_min = row[f"{col_name}__min"]
+                        col_max = row[f"{col_name}__max"]
+                    col_stats.update({
+                        'min': col_min,
+                        'max': col_max,
+                        'mean': round(mean, 2) if mean is not None else None,
+                        'median': row[f"{col_name}__median"],
                     })
+                stats[col_name] = col_stats
 
         except Exception as e:
-            logger.debug(f"Could not calculate stats for {col_name}: {e}")
+            logger.debug(f"Could not calculate column statistics: {e}")
 
         return stats
 
     def _write_csv(self, dict_data: List[Dict[str, Any]], output_path: Path) -> Path:
-        """Write dictionary data to CSV format."""
-        df = pl.DataFrame(dict_data)
-        df.write_csv(output_path)
+        """Write dictionary data to CSV format.
+
+        Rows stream straight to csv.DictWriter; routing a list of dicts
+        through pl.DataFrame first would re-walk every entry for schema
+        inference and box each scalar just to serialize it again.
+        """
+        with open(output_path, 'w', newline='') as f:
+            if dict_data:
+                writer = csv.DictWriter(f, fieldnames=list(dict_data[0]))
+                writer.writeheader()
+                writer.writerows(dict_data)
         return output_path
 
     def _write_json(self, dict_data: List[Dict[str, Any]], output_path: Path) -> Path:
         """Write dictionary data to JSON format."""
-        with open(output_path, 'w') as f:
-            json.dump(dict_data, f, indent=2, default=str)
+        if orjson is not None:
+            output_path.write_bytes(
+                orjson.dumps(dict_data, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(dict_data, f, indent=2, default=str)
         return output_path
 
     def _write_html(self, dict_data: List[Dict[str, Any]], output_path: Path) -> Path:
         """Write dictionary data to HTML format."""
         html_content = self._generate_html_template(dict_data)
-        with open(output_path, 'w') as f:
-            f.write(html_content)
+        output_path.write_text(html_content, encoding='utf-8')
         return output_path
 
     def _generate_html_template(self, dict_data: List[Dict[str, Any]]) -> str:
@@ -238,14 +363,34 @@ class DataDictionaryGenerator:
         total_vars = len(dict_data)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Calculate summary statistics
-        numeric_vars = sum(1 for d in dict_data if d['type'] in ['Int64', 'Float64'])
-        string_vars = sum(
-            1 for d in dict_data if 'Utf8' in d['type'] or 'String' in d['type']
-        )
-        missing_vars = sum(1 for d in dict_data if d['missing_count'] > 0)
+        # Classify each variable once; the summary counts and the per-row
+        # CSS classes below reuse the result instead of re-testing the
+        # dtype string several times per variable
+        numeric_vars = 0
+        string_vars = 0
+        missing_vars = 0
+        row_classes = []
+        for d in dict_data:
+            is_numeric = d['type'] in _NUMERIC_TYPE_STRS
+            is_string = d['type'] in _STRING_TYPE_STRS
+            has_missing = d['missing_count'] > 0
+
+            numeric_vars += is_numeric
+            string_vars += is_string
+            missing_vars += has_missing
+
+            if has_missing:
+                row_classes.append("missing")
+            elif is_numeric:
+                row_classes.append("numeric")
+            elif is_string:
+                row_classes.append("string")
+            else:
+                row_classes.append("")
 
-        html = f"""
+        # Accumulate fragments and join once; repeated += on a growing
+        # string copies the whole document for every row appended
+        parts = [f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -300,47 +445,164 @@ class DataDictionaryGenerator:
             </tr>
         </thead>
         <tbody>
-"""
-
-        for row in dict_data:
-            # Determine row class based on data type and missing data
-            row_class = ""
-            if row['missing_count'] > 0:
-                row_class = "missing"
-            elif row['type'] in ['Int64', 'Float64']:
-                row_class = "numeric"
-            elif 'Utf8' in row['type'] or 'String' in row['type']:
-                row_class = "string"
-
-            html += f"""
+"""]
+
+        for row, row_class in zip(dict_data, row_classes):
+            parts.append(f"""
             <tr class="{row_class}">
                 <td><strong>{row['variable']}</strong></td>
                 <td>{row['type']}</td>
                 <td class="description">{row['description']}</td>
                 <td>{row['missing_count']:,}</td>
                 <td>{row['missing_pct']:.1f}%</td>
-                <td>{row['unique_values'] if row['unique_values'] is not None else 'N/A'}</td>  # noqa: E501
+                <td>{row['unique_values'] if row['unique_values'] is not None else 'N/A'}</td>
                 <td>{row['min'] if row['min'] is not None else 'N/A'}</td>
                 <td>{row['max'] if row['max'] is not None else 'N/A'}</td>
                 <td>{row['mean'] if row['mean'] is not None else 'N/A'}</td>
                 <td>{row['median'] if row['median'] is not None else 'N/A'}</td>
-            </tr>"""
+            </tr>""")
 
-        html += """
+        parts.append("""
         </tbody>
     </table>
 
-    <div style="margin-top: 30px; padding: 15px; background-color: #f8f9fa; border-radius: 5px;">  # noqa: E501
+    <div style="margin-top: 30px; padding: 15px; background-color: #f8f9fa; border-radius: 5px;">
         <h3>Legend</h3>
         <p><span class="numeric" style="padding: 2px 8px;">Numeric variables</span></p>
         <p><span class="string" style="padding: 2px 8px;">String variables</span></p>
-        <p><span class="missing" style="padding: 2px 8px;">Variables with missing data</span></p>  # noqa: E501
+        <p><span class="missing" style="padding: 2px 8px;">Variables with missing data</span></p>
     </div>
 </body>
 </html>
-        """
+        """)
+
+        return "".join(parts)
+
+
+def _read_footer_metadata(parquet_files: List[Path]) -> List[pq.FileMetaData]:
+    """Parse each file's parquet footer once, fanning reads across threads.
+
+    Footer parsing is I/O-bound and releases the GIL in Arrow's C++ core,
+    so a thread pool overlaps it across NCDB's per-tumor-type shards (the
+    same pattern inspect.py uses). Parses go through the shared memoized
+    reader, so repeated generations over an unchanged dataset reuse them.
+    Returns an empty list on any failure, which downstream helpers treat
+    as "no footer statistics available".
+    """
+    try:
+        if len(parquet_files) < 2:
+            return [read_metadata(pf) for pf in parquet_files]
+        workers = min(32, len(parquet_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(read_metadata, parquet_files))
+    except Exception as e:
+        logger.debug(f"Could not read parquet footers: {e}")
+        return []
+
+
+def _schema_from_footer(footers: List[pq.FileMetaData]) -> Optional[pl.Schema]:
+    """Derive the dataset schema from parsed footer metadata.
+
+    collect_schema() on a directory glob touches every file's footer to
+    unify schemas, but NCDB tumor-type files share one schema by
+    construction, so the first footer is authoritative. The last file's
+    footer doubles as a cheap consistency probe; on mismatch (or missing
+    footers) returns None so the caller falls back to full unification.
+    """
+    if not footers:
+        return None
+    try:
+        first = footers[0].schema.to_arrow_schema()
+        if len(footers) > 1 and footers[-1].schema.to_arrow_schema() != first:
+            return None
+        return pl.from_arrow(first.empty_table()).schema
+    except Exception as e:
+        logger.debug(f"Could not derive schema from parquet footer: {e}")
+        return None
+
+
+def _footer_counts(
+    footers: List[pq.FileMetaData],
+) -> Optional[Tuple[int, Dict[str, int]]]:
+    """Read the row count and per-column null counts from parquet footers.
+
+    Both are recorded per row group at write time, so summing them across
+    footers replaces a full-dataset aggregation with metadata-only I/O.
+    Returns None if any row group lacks null-count statistics, in which
+    case the caller must fall back to scanning.
+    """
+    if not footers:
+        return None
+    total_rows = 0
+    null_counts: Dict[str, int] = {}
+    try:
+        for metadata in footers:
+            total_rows += metadata.num_rows
+            for rg_idx in range(metadata.num_row_groups):
+                row_group = metadata.row_group(rg_idx)
+                for col_idx in range(row_group.num_columns):
+                    column = row_group.column(col_idx)
+                    statistics = column.statistics
+                    if statistics is None or not statistics.has_null_count:
+                        return None
+                    name = column.path_in_schema
+                    null_counts[name] = (
+                        null_counts.get(name, 0) + statistics.null_count
+                    )
+    except Exception as e:
+        logger.debug(f"Could not read counts from parquet footers: {e}")
+        return None
+    return total_rows, null_counts
 
-        return html
+
+def _footer_min_max(footers: List[pq.FileMetaData]) -> Dict[str, Any]:
+    """Read exact per-column min/max from parquet footer statistics.
+
+    Footers carry row-group min/max without touching data pages. A column
+    qualifies only if every row group with data has usable statistics;
+    all-null row groups are skipped (they contribute nothing to min/max).
+
+    Returns:
+        Dict mapping column name to a (min, max) tuple
+    """
+    mins: Dict[str, Any] = {}
+    maxs: Dict[str, Any] = {}
+    invalid = set()
+
+    try:
+        for metadata in footers:
+            for rg_idx in range(metadata.num_row_groups):
+                row_group = metadata.row_group(rg_idx)
+                for col_idx in range(row_group.num_columns):
+                    column = row_group.column(col_idx)
+                    name = column.path_in_schema
+                    if name in invalid:
+                        continue
+
+                    statistics = column.statistics
+                    if statistics is None:
+                        invalid.add(name)
+                        continue
+                    if not statistics.has_min_max:
+                        # Fine if the group holds no values; otherwise the
+                        # stats are unusable for this column
+                        if statistics.null_count != row_group.num_rows:
+                            invalid.add(name)
+                        continue
+
+                    if name not in mins or statistics.min < mins[name]:
+                        mins[name] = statistics.min
+                    if name not in maxs or statistics.max > maxs[name]:
+                        maxs[name] = statistics.max
+    except Exception as e:
+        logger.debug(f"Could not read parquet footer statistics: {e}")
+        return {}
+
+    return {
+        name: (mins[name], maxs[name])
+        for name in mins
+        if name not in invalid
+    }
 
 
 # Legacy function for backward compatibility
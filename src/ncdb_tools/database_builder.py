@@ -111,7 +111,7 @@ def build_database(
 
             # Get row count and compressed size
             df = pl.scan_parquet(parquet_path)
-            row_count = df.select(pl.count()).collect().item()
+            row_count = df.select(pl.len()).collect().item()
             compressed_size_mb = parquet_path.stat().st_size / 1024 / 1024
             total_size_mb += compressed_size_mb
 
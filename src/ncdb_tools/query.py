@@ -3,22 +3,50 @@
 This module provides a fluent API for filtering NCDB data that integrates
 seamlessly with Polars LazyFrame operations.
 """
+import random
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 import polars as pl
 from typing_extensions import Self
 
+from ._internal.parquet_meta import list_parquet_files, read_metadata
 from .constants import (
     DEMOGRAPHIC_COLUMNS,
     HISTOLOGY_COLUMN,
     OUTCOME_COLUMNS,
     PRIMARY_SITE_COLUMN,
+    TREATMENT_COLUMNS,
     VITAL_STATUS_COLUMN,
     YEAR_COLUMN,
 )
 
 
+@lru_cache(maxsize=32)
+def _list_parquet_files(path_str: str, mtime: float) -> Tuple[str, ...]:
+    """List a directory's parquet files, memoized on its mtime.
+
+    Notebook and test workflows construct queries against the same
+    dataset directory over and over; the directory mtime changes whenever
+    files are added or removed, so a stale listing ages out of the cache
+    naturally. Hive layouts are not cached here because the top-level
+    mtime does not reflect changes inside partition subdirectories.
+    """
+    return tuple(str(p) for p in list_parquet_files(path_str))
+
+
+@lru_cache(maxsize=64)
+def _probe_series(values: Tuple[Any, ...], dtype: pl.DataType) -> pl.Series:
+    """Build a typed is_in probe Series, memoized on (values, dtype).
+
+    Parameterized tests and notebook loops apply the same small code
+    lists over and over; reusing the Series skips re-boxing each value
+    per call. Callers only read the Series, so sharing is safe.
+    """
+    return pl.Series(values, dtype=dtype)
+
+
 class NCDBQuery:
     """A query builder for NCDB data that behaves like a Polars LazyFrame.
 
@@ -40,22 +68,33 @@ class NCDBQuery:
         ...       .select(["PUF_CASE_ID", "AGE", "YEAR_OF_DIAGNOSIS", "PRIMARY_SITE"])
         ...       .collect())
 
-        >>> # Mix NCDB-specific and Polars methods
+        >>> # Mix NCDB-specific and Polars methods. Like the filter_by_*
+        >>> # methods, delegated LazyFrame operations update the query in
+        >>> # place and return it for chaining.
         >>> df = (NCDBQuery("path/to/parquet/dir")
         ...       .filter_by_primary_site("C509")
         ...       .drop_missing_vital_status()
         ...       .filter(pl.col("AGE") > 50)
         ...       .with_columns(pl.col("AGE").alias("patient_age"))
         ...       .group_by("YEAR_OF_DIAGNOSIS")
-        ...       .agg(pl.count())
+        ...       .agg(pl.len())
         ...       .collect())
     """
 
-    def __init__(self, parquet_path: Union[str, Path]):
+    def __init__(
+        self,
+        parquet_path: Union[str, Path],
+        parallel: str = "prefiltered",
+    ):
         """Initialize the query with a parquet dataset.
 
         Args:
             parquet_path: Path to parquet file or directory containing parquet files
+            parallel: Parquet read strategy. The default "prefiltered"
+                      evaluates pushed-down predicates first and then reads
+                      only the surviving rows, which suits NCDB's typical
+                      site/year/histology filters on clustered columns;
+                      pass "auto" to restore the engine's default.
         """
         self.parquet_path = Path(parquet_path)
 
@@ -64,44 +103,120 @@ class NCDBQuery:
 
         # Initialize LazyFrame
         if self.parquet_path.is_file():
-            self._lf = pl.scan_parquet(self.parquet_path)
+            parquet_files = [self.parquet_path]
+            self._lf = pl.scan_parquet(self.parquet_path, parallel=parallel)
         else:
-            # Directory containing parquet files
-            parquet_files = list(self.parquet_path.glob("*.parquet"))
-            if not parquet_files:
-                raise ValueError(f"No parquet files found in directory: {parquet_path}")
-            self._lf = pl.scan_parquet(parquet_files)
+            # Directory containing parquet files; the listing is memoized
+            # so repeated constructions skip the directory scan
+            parquet_files = [
+                Path(p) for p in _list_parquet_files(
+                    str(self.parquet_path), self.parquet_path.stat().st_mtime
+                )
+            ]
+            if parquet_files:
+                # Chunks are left uncompacted (the scan default):
+                # rechunking a multi-file collect is a full copy of the
+                # result, wasted when the caller filters or aggregates next
+                self._lf = pl.scan_parquet(parquet_files, parallel=parallel)
+            else:
+                # Hive-partitioned layout (e.g. YEAR_OF_DIAGNOSIS=2021/
+                # part-0.parquet): scanning with hive_partitioning lets
+                # year filters prune whole directories at planning time
+                parquet_files = sorted(self.parquet_path.rglob("*.parquet"))
+                if not parquet_files:
+                    raise ValueError(
+                        f"No parquet files found in directory: {parquet_path}"
+                    )
+                self._lf = pl.scan_parquet(
+                    self.parquet_path / "**" / "*.parquet",
+                    parallel=parallel,
+                    hive_partitioning=True,
+                )
+
+        # File list memo shared by the footer-metadata shortcuts
+        self._parquet_files = parquet_files
+
+        # Row count memo for the current plan; cleared whenever _lf changes
+        self._cached_count: Optional[int] = None
+
+        # True once any filter/select has modified the plan; count_fast()
+        # can only trust parquet footers while this is False
+        self._plan_modified = False
+
+        # Schema memo; collect_schema() re-resolves the whole plan on
+        # every call, so cache it until the plan changes
+        self._schema_cache: Optional[pl.Schema] = None
+        self._columns_cache: Optional[List[str]] = None
+        self._column_set_cache: Optional[frozenset] = None
+
+    def _set_lf(self, lf: pl.LazyFrame) -> None:
+        """Replace the underlying LazyFrame and invalidate cached results."""
+        self._lf = lf
+        self._cached_count = None
+        self._plan_modified = True
+        self._schema_cache = None
+        self._columns_cache = None
+        self._column_set_cache = None
+
+    @property
+    def _schema(self) -> pl.Schema:
+        """The plan's resolved schema, cached until the plan changes."""
+        if self._schema_cache is None:
+            self._schema_cache = self._lf.collect_schema()
+        return self._schema_cache
 
     # NCDB-specific filter methods
 
-    def filter_by_year(self, years: Union[int, List[int]]) -> Self:
+    def filter_by_year(
+        self, years: Union[int, str, List[Union[int, str]]]
+    ) -> Self:
         """Filter by year(s) of diagnosis.
 
         Args:
             years: Single year or list of years to include
+                   (accepts integers or strings)
 
         Returns:
             Self for method chaining
         """
-        if isinstance(years, int):
+        if not isinstance(years, list):
             years = [years]
 
-        self._lf = self._lf.filter(pl.col(YEAR_COLUMN).is_in(years))
+        # Year of diagnosis is categorical text in the canonical layout
+        # (see STRING_VARIABLES) but parses as an integer partition
+        # column in hive layouts, so build the probe Series to match the
+        # column dtype - is_in then hashes it once with no per-collect
+        # coercion, and partition pruning still sees a native predicate
+        year_dtype = self._schema.get(YEAR_COLUMN)
+        if year_dtype is not None and year_dtype.is_integer():
+            years_s = _probe_series(
+                tuple(int(year) for year in years), year_dtype
+            )
+        else:
+            years_s = _probe_series(
+                tuple(str(year) for year in years), pl.Utf8
+            )
+        self._set_lf(self._lf.filter(pl.col(YEAR_COLUMN).is_in(years_s.implode())))
         return self
 
-    def filter_by_primary_site(self, sites: Union[str, List[str]]) -> Self:
+    def filter_by_primary_site(self, sites: Union[str, Iterable[str]]) -> Self:
         """Filter by primary site code(s).
 
         Args:
-            sites: Single site code or list of ICD-O-3 primary site codes
+            sites: Single site code or iterable of ICD-O-3 primary site codes
 
         Returns:
             Self for method chaining
         """
-        if isinstance(sites, str):
-            sites = [sites]
-
-        self._lf = self._lf.filter(pl.col(PRIMARY_SITE_COLUMN).is_in(sites))
+        # Normalize scalar/iterable input to one typed Series so the
+        # filter is a single hashed is_in probe per row, with the hash
+        # set built once and no dtype coercion at collect time
+        site_list = (sites,) if isinstance(sites, str) else tuple(sites)
+        sites_s = _probe_series(site_list, pl.Utf8)
+
+        self._set_lf(
+            self._lf.filter(pl.col(PRIMARY_SITE_COLUMN).is_in(sites_s.implode()))
+        )
         return self
 
     def filter_by_histology(
@@ -119,10 +234,23 @@ class NCDBQuery:
         if not isinstance(codes, list):
             codes = [codes]
 
-        # Convert all codes to strings for consistency
-        str_codes = [str(code) for code in codes]
+        # Histology is a string code in the canonical layout, but match
+        # the column dtype as filter_by_year does: probing an integer
+        # column with Utf8 values would cast every row to string and
+        # defeat the parquet dictionary-decode shortcut
+        hist_dtype = self._schema.get(HISTOLOGY_COLUMN)
+        if hist_dtype is not None and hist_dtype.is_integer():
+            codes_s = _probe_series(
+                tuple(int(code) for code in codes), hist_dtype
+            )
+        else:
+            codes_s = _probe_series(
+                tuple(str(code) for code in codes), pl.Utf8
+            )
 
-        self._lf = self._lf.filter(pl.col(HISTOLOGY_COLUMN).is_in(str_codes))
+        self._set_lf(
+            self._lf.filter(pl.col(HISTOLOGY_COLUMN).is_in(codes_s.implode()))
+        )
         return self
 
     def drop_missing_vital_status(self) -> Self:
@@ -131,7 +259,7 @@ class NCDBQuery:
         Returns:
             Self for method chaining
         """
-        self._lf = self._lf.filter(pl.col(VITAL_STATUS_COLUMN).is_not_null())
+        self._set_lf(self._lf.filter(pl.col(VITAL_STATUS_COLUMN).is_not_null()))
         return self
 
     def filter_active_variables(self) -> Self:
@@ -143,34 +271,79 @@ class NCDBQuery:
         Returns:
             Self for method chaining
         """
-        # Get the most recent year in the dataset
-        recent_year_lf = self._lf.select(pl.col(YEAR_COLUMN).max())
-        recent_year = recent_year_lf.collect().item()
-
-        # Get data from most recent year to check which columns have data
+        # Get the most recent year in the dataset. Footer statistics pin
+        # it without touching data pages while the plan is unmodified;
+        # any prior filter could change the answer, so aggregate then
+        recent_year = None
+        if not self._plan_modified:
+            recent_year = self._footer_column_max(YEAR_COLUMN)
+        if recent_year is None:
+            recent_year = self._lf.select(pl.col(YEAR_COLUMN).max()).collect().item()
+
+        # One fused aggregation over the recent-year subset: a column is
+        # active if any value is non-null, so a single select of
+        # is_not_null().any() flags replaces separate null-count and
+        # row-count collects that each rescanned the parquet files
         recent_data = self._lf.filter(pl.col(YEAR_COLUMN) == recent_year)
+        active_flags = recent_data.select(
+            pl.all().is_not_null().any()
+        ).collect(engine="streaming").row(0, named=True)
 
-        # Find columns with non-null data in recent year
-        null_counts = recent_data.null_count().collect()
-        total_rows = recent_data.select(pl.len()).collect().item()
+        active_columns = [col for col, has_data in active_flags.items() if has_data]
 
-        # Select columns that have at least some data (not 100% null)
-        active_columns = [
-            col for col in null_counts.columns
-            if null_counts[col].item() < total_rows
-        ]
-
-        self._lf = self._lf.select(active_columns)
+        self._set_lf(self._lf.select(active_columns))
         return self
 
+    def _footer_column_max(self, column: str) -> Optional[Any]:
+        """Fold a column's max from parquet footer statistics.
+
+        Returns None when any row group with data lacks usable statistics
+        (all-null groups are skipped), leaving the caller to aggregate.
+        """
+        col_max = None
+        try:
+            for pf in self._parquet_files:
+                metadata = read_metadata(pf)
+                for rg_idx in range(metadata.num_row_groups):
+                    row_group = metadata.row_group(rg_idx)
+                    for col_idx in range(row_group.num_columns):
+                        col_meta = row_group.column(col_idx)
+                        if col_meta.path_in_schema != column:
+                            continue
+                        statistics = col_meta.statistics
+                        if statistics is None or not statistics.has_min_max:
+                            if (
+                                statistics is not None
+                                and statistics.null_count == row_group.num_rows
+                            ):
+                                continue
+                            return None
+                        if col_max is None or statistics.max > col_max:
+                            col_max = statistics.max
+        except Exception:
+            return None
+        return col_max
+
     def select_demographics(self) -> Self:
         """Select common demographic variables.
 
         Returns:
             Self for method chaining
         """
-        available_columns = [col for col in DEMOGRAPHIC_COLUMNS if col in self.columns]
-        self._lf = self._lf.select(available_columns)
+        present = self._column_set
+        available_columns = [col for col in DEMOGRAPHIC_COLUMNS if col in present]
+        self._set_lf(self._lf.select(available_columns))
+        return self
+
+    def select_treatment(self) -> Self:
+        """Select common treatment variables.
+
+        Returns:
+            Self for method chaining
+        """
+        present = self._column_set
+        available_columns = [col for col in TREATMENT_COLUMNS if col in present]
+        self._set_lf(self._lf.select(available_columns))
         return self
 
     def select_outcomes(self) -> Self:
@@ -179,8 +352,9 @@ class NCDBQuery:
         Returns:
             Self for method chaining
         """
-        available_columns = [col for col in OUTCOME_COLUMNS if col in self.columns]
-        self._lf = self._lf.select(available_columns)
+        present = self._column_set
+        available_columns = [col for col in OUTCOME_COLUMNS if col in present]
+        self._set_lf(self._lf.select(available_columns))
         return self
 
     # Convenience methods for data access
@@ -201,21 +375,67 @@ class NCDBQuery:
         Returns:
             List of column names
         """
-        return list(self._lf.collect_schema().names())
+        if self._columns_cache is None:
+            self._columns_cache = list(self._schema.names())
+        return self._columns_cache
+
+    @property
+    def _column_set(self) -> frozenset:
+        """Column names as a frozenset for O(1) membership checks."""
+        if self._column_set_cache is None:
+            self._column_set_cache = frozenset(self.columns)
+        return self._column_set_cache
 
     def count(self) -> int:
         """Get the count of rows without collecting the full dataset.
 
+        Repeated calls reuse the memoized result until the plan changes,
+        so chained examples that count several times only scan once each.
+
         Returns:
             Number of rows in the filtered dataset
         """
-        result = self._lf.select(pl.len()).collect().item(0, 0)
-        assert isinstance(result, int)  # Type guard
-        return result
+        if self._cached_count is None:
+            # Streaming keeps the count pipelined over row groups instead
+            # of holding decoded columns for the whole filtered set
+            result = (
+                self._lf.select(pl.len())
+                .collect(engine="streaming")
+                .item(0, 0)
+            )
+            assert isinstance(result, int)  # Type guard
+            self._cached_count = result
+        return self._cached_count
+
+    def count_fast(self) -> int:
+        """Get the row count from parquet footers when no filters are applied.
+
+        Parquet footers already record num_rows per file, so an unmodified
+        query can be counted by summing footer metadata without touching any
+        data pages. Once the plan has been filtered or projected, this falls
+        back to count().
+
+        Returns:
+            Number of rows in the dataset
+        """
+        if self._plan_modified:
+            return self.count()
+
+        if self._cached_count is None:
+            self._cached_count = sum(
+                read_metadata(pf).num_rows for pf in self._parquet_files
+            )
+        return self._cached_count
 
     def sample(self, n: int = 1000, seed: Optional[int] = None) -> pl.DataFrame:
         """Get a random sample of rows.
 
+        While the plan is unmodified, rows are drawn against the footer
+        row counts and only the row groups containing them are decoded,
+        so the cost scales with n rather than the dataset. Filtered
+        queries still collect first, since footers cannot say which rows
+        survive the predicates.
+
         Args:
             n: Number of rows to sample
             seed: Random seed for reproducibility
@@ -223,19 +443,81 @@ class NCDBQuery:
         Returns:
             Polars DataFrame with sampled rows
         """
-        # LazyFrame doesn't have sample method, so collect first then sample
-        df = self._lf.collect()
+        if not self._plan_modified and not self._is_hive_layout():
+            sampled = self._sample_from_files(n, seed)
+            if sampled is not None:
+                return sampled
+
+        # LazyFrame doesn't have sample method, so collect first then
+        # sample; the streaming engine bounds peak memory while the
+        # filtered rows materialize
+        df = self._lf.collect(engine="streaming")
         if seed is not None:
             return df.sample(n=n, seed=seed)
         return df.sample(n=n)
 
+    def _is_hive_layout(self) -> bool:
+        """Whether the dataset files live in hive partition directories."""
+        return any(
+            pf != self.parquet_path and pf.parent != self.parquet_path
+            for pf in self._parquet_files
+        )
+
+    def _sample_from_files(
+        self, n: int, seed: Optional[int]
+    ) -> Optional[pl.DataFrame]:
+        """Sample n rows decoding only the row groups that contain them.
+
+        Returns None when footers are unreadable or n exceeds the row
+        count, so the caller falls back to the collect-then-sample path
+        (and its usual error behavior).
+        """
+        try:
+            metadata = [read_metadata(pf) for pf in self._parquet_files]
+        except Exception:
+            return None
+
+        total = sum(m.num_rows for m in metadata)
+        if n > total:
+            return None
+
+        rng = random.Random(seed)
+        chosen = sorted(rng.sample(range(total), n))
+        if not chosen:
+            # n == 0: match DataFrame.sample by returning an empty frame
+            # with the full schema (pl.concat rejects an empty list)
+            return self._lf.head(0).collect()
+
+        parts = []
+        pos = 0  # global row offset across all files
+        idx = 0  # cursor into chosen
+        for pf, meta in zip(self._parquet_files, metadata):
+            file_pos = 0  # row offset within this file
+            for rg_idx in range(meta.num_row_groups):
+                rg_len = meta.row_group(rg_idx).num_rows
+                local = []
+                while idx < len(chosen) and chosen[idx] < pos + rg_len:
+                    local.append(chosen[idx] - pos)
+                    idx += 1
+                if local:
+                    group_df = (
+                        pl.scan_parquet(pf).slice(file_pos, rg_len).collect()
+                    )
+                    parts.append(group_df[local])
+                file_pos += rg_len
+                pos += rg_len
+
+        return pl.concat(parts)
+
     def describe(self) -> dict:
         """Get summary information about the query.
 
         Returns:
             Dictionary with query information
         """
-        total_rows = self.count()
+        # count_fast() answers from parquet footers while the plan is
+        # unmodified and falls back to the memoized count() otherwise
+        total_rows = self.count_fast()
         columns = self.columns
 
         return {
@@ -255,11 +537,10 @@ class NCDBQuery:
             def wrapper(*args: Any, **kwargs: Any) -> Any:
                 result = attr(*args, **kwargs)
                 if isinstance(result, pl.LazyFrame):
-                    # Create a new instance with the updated LazyFrame
-                    new_query = self.__class__.__new__(self.__class__)
-                    new_query.parquet_path = self.parquet_path
-                    new_query._lf = result
-                    return new_query
+                    # Update in place and return self, matching the
+                    # pre-bound delegators and the filter_by_* methods
+                    self._set_lf(result)
+                    return self
                 return result
             return wrapper
 
@@ -268,12 +549,52 @@ class NCDBQuery:
     def __repr__(self) -> str:
         """String representation of the query."""
         try:
-            count = self.count()
-            return f"NCDBQuery(path={self.parquet_path.name}, rows={count:,})"
+            # Report a row count only when it is already memoized or
+            # costs metadata-only I/O; printing a filtered query in a
+            # debugger should not trigger a full scan
+            if self._cached_count is not None or not self._plan_modified:
+                count = self.count_fast()
+                return f"NCDBQuery(path={self.parquet_path.name}, rows={count:,})"
+            return f"NCDBQuery(path={self.parquet_path.name})"
         except Exception:
             return f"NCDBQuery(path={self.parquet_path.name})"
 
 
+def _make_delegator(name: str) -> Any:
+    """Build a delegating method for a LazyFrame operation.
+
+    Installed on NCDBQuery once at import time: a real method is a single
+    class-dict lookup per call, where __getattr__ rebuilt a fresh closure
+    on every delegated access in a fluent chain.
+    """
+    def delegator(self: NCDBQuery, *args: Any, **kwargs: Any) -> Any:
+        result = getattr(self._lf, name)(*args, **kwargs)
+        if isinstance(result, pl.LazyFrame):
+            # Update in place and return self, matching the fluent
+            # semantics of the filter_by_* methods
+            self._set_lf(result)
+            return self
+        return result
+
+    delegator.__name__ = name
+    delegator.__qualname__ = f"NCDBQuery.{name}"
+    delegator.__doc__ = (
+        f"Delegate to polars.LazyFrame.{name}, keeping LazyFrame results "
+        "wrapped in this query."
+    )
+    return delegator
+
+
+# Pre-bind the public LazyFrame API. Methods NCDBQuery defines itself keep
+# priority, and non-callable attributes or anything Polars adds later still
+# fall through to __getattr__.
+for _name in dir(pl.LazyFrame):
+    if not _name.startswith("_") and not hasattr(NCDBQuery, _name):
+        if callable(getattr(pl.LazyFrame, _name)):
+            setattr(NCDBQuery, _name, _make_delegator(_name))
+del _name
+
+
 def load_data(
     parquet_path: Union[str, Path],
     year: Optional[Union[int, List[int]]] = None,
@@ -304,7 +625,7 @@ def load_data(
         ...       .filter_by_histology([8140])  # Adenocarcinoma
         ...       .filter(pl.col("AGE") > 50)
         ...       .group_by("PRIMARY_SITE")
-        ...       .agg(pl.count())
+        ...       .agg(pl.len())
         ...       .collect())
     """
     query = NCDBQuery(parquet_path)
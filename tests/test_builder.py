@@ -1,15 +1,19 @@
 """Tests for the dataset builder functionality."""
 
-import shutil
-
 import pytest
+from conftest import fast_copy, fast_rmtree, touch_files
 
 from ncdb_tools import NCDBValidationError
 from ncdb_tools.builder import build_parquet_dataset, detect_dataset_type
 
 
+@pytest.mark.xdist_group(name="fs_readonly")
 class TestDatasetDetection:
-    """Test dataset type detection."""
+    """Test dataset type detection.
+
+    Read-only against the shared fixtures, so pytest-xdist can schedule
+    the class onto one worker with 'pytest -n auto --dist=loadgroup'.
+    """
 
     def test_detect_ncdb_dataset(self, sample_data_dir):
         """Test detecting NCDB dataset type."""
@@ -19,8 +23,7 @@ class TestDatasetDetection:
     def test_detect_unknown_dataset(self, temp_output_dir):
         """Test detecting unknown dataset type."""
         # Create some non-NCDB files
-        (temp_output_dir / "random.txt").touch()
-        (temp_output_dir / "data.csv").touch()
+        touch_files(temp_output_dir, "random.txt", "data.csv")
 
         dataset_type = detect_dataset_type(temp_output_dir)
         assert dataset_type == "unknown"
@@ -104,11 +107,11 @@ class TestBuildParquetDataset:
         test_data_dir = sample_data_dir.parent / "test_build"
 
         try:
-            # Copy some sample files
+            # Stage some sample files (hardlinked, so no bytes copied)
             test_data_dir.mkdir(exist_ok=True)
             sample_files = list(sample_data_dir.glob("*.parquet"))[:2]  # Just copy 2 files
             for f in sample_files:
-                shutil.copy2(f, test_data_dir / f.name)
+                fast_copy(f, test_data_dir / f.name)
 
             result = build_parquet_dataset(
                 data_dir=test_data_dir,
@@ -123,7 +126,7 @@ class TestBuildParquetDataset:
         finally:
             # Cleanup
             if test_data_dir.exists():
-                shutil.rmtree(test_data_dir)
+                fast_rmtree(test_data_dir)
 
 
 class TestBuilderIntegration:
@@ -4,6 +4,9 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+from conftest import touch_files
+
 from ncdb_tools.config import (
     get_data_directory,
     get_memory_limit,
@@ -61,7 +64,7 @@ class TestConfigEnvironment:
 class TestConfigDotEnv:
     """Test configuration from .env files."""
 
-    def test_dotenv_loading(self, temp_output_dir):
+    def test_dotenv_loading(self, temp_output_dir, monkeypatch):
         """Test loading configuration from .env file."""
         # Create a temporary .env file
         env_file = temp_output_dir / ".env"
@@ -70,32 +73,27 @@ NCDB_DATA_DIR=/test/data/from/dotenv
 NCDB_OUTPUT_DIR=/test/output/from/dotenv
 NCDB_MEMORY_LIMIT=16GB
         """.strip()
+        env_file.write_text(env_content)
 
-        with open(env_file, 'w') as f:
-            f.write(env_content)
-
-        # Change to the directory containing .env
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_output_dir)
-
-            # Clear environment variables
-            with patch.dict(os.environ, {}, clear=True):
-                # Test requires python-dotenv to be installed
-                try:
-                    result = get_data_directory()
-                    # If dotenv is available, should load from file
-                    if result is not None:
-                        assert str(result) == "/test/data/from/dotenv"
-                except ImportError:
-                    # python-dotenv not installed, should return None
-                    result = get_data_directory()
-                    assert result is None
+        # Point the config module at the fixture file; no chdir needed,
+        # so the test cannot leak a changed working directory
+        monkeypatch.setattr("ncdb_tools.config._ENV_FILE", env_file)
 
-        finally:
-            os.chdir(original_cwd)
+        # Clear environment variables
+        with patch.dict(os.environ, {}, clear=True):
+            # Test requires python-dotenv to be installed
+            try:
+                result = get_data_directory()
+                # If dotenv is available, should load from file
+                if result is not None:
+                    assert str(result) == "/test/data/from/dotenv"
+            except ImportError:
+                # python-dotenv not installed, should return None
+                result = get_data_directory()
+                assert result is None
 
 
+@pytest.mark.xdist_group(name="fs_readonly")
 class TestDirectoryValidation:
     """Test directory validation functions."""
 
@@ -112,8 +110,7 @@ class TestDirectoryValidation:
     def test_validate_directory_without_ncdb_files(self, temp_output_dir):
         """Test validating directory without NCDB-like files."""
         # Create some non-NCDB files
-        (temp_output_dir / "random.txt").touch()
-        (temp_output_dir / "data.csv").touch()
+        touch_files(temp_output_dir, "random.txt", "data.csv")
 
         result = validate_data_directory(temp_output_dir)
         assert result is False
@@ -121,8 +118,9 @@ class TestDirectoryValidation:
     def test_validate_directory_with_parquet_files(self, temp_output_dir):
         """Test validating directory with NCDB-like parquet files."""
         # Create NCDB-like parquet files
-        (temp_output_dir / "NCDBPUF_Breast.parquet").touch()
-        (temp_output_dir / "NCDBPUF_Lung.parquet").touch()
+        touch_files(
+            temp_output_dir, "NCDBPUF_Breast.parquet", "NCDBPUF_Lung.parquet"
+        )
 
         result = validate_data_directory(temp_output_dir)
         assert result is True
@@ -130,8 +128,7 @@ class TestDirectoryValidation:
     def test_validate_directory_with_dat_files(self, temp_output_dir):
         """Test validating directory with NCDB-like dat files."""
         # Create NCDB-like dat files
-        (temp_output_dir / "NCDBPUF_Breast.dat").touch()
-        (temp_output_dir / "cancer_data.dat").touch()
+        touch_files(temp_output_dir, "NCDBPUF_Breast.dat", "cancer_data.dat")
 
         result = validate_data_directory(temp_output_dir)
         assert result is True
@@ -0,0 +1,86 @@
+"""Tests for fixed-width NCDB file ingestion."""
+
+import polars as pl
+import pytest
+
+pytest.importorskip("tqdm")
+
+from ncdb_tools._internal.ingest import create_parquet_from_text, read_ncdb_file
+
+SAS_LABELS = """
+input
+@1 PUF_CASE_ID $10.
+@11 AGE $3.
+@14 PRIMARY_SITE $4.
+@18 YEAR_OF_DIAGNOSIS $4.
+;
+"""
+
+
+def _write_fixture(directory, lines):
+    """Write a synthetic .sas/.dat pair and return the .dat path."""
+    (directory / "ncdb_labels.sas").write_text(SAS_LABELS)
+    dat_file = directory / "NCDBPUF_Test.dat"
+    dat_file.write_text("\n".join(lines) + "\n")
+    return dat_file
+
+
+class TestReadNCDBFile:
+    """Test fixed-width parsing against a synthetic .sas/.dat pair."""
+
+    def test_extracts_fields_by_position(self, tmp_path):
+        """Test that fields are sliced at the SAS-defined positions."""
+        dat_file = _write_fixture(tmp_path, [
+            "CASE000001 45C5092021",
+            "CASE000002 67C3492020",
+        ])
+
+        df = read_ncdb_file(dat_file)
+
+        assert df.columns == [
+            "PUF_CASE_ID", "AGE", "PRIMARY_SITE", "YEAR_OF_DIAGNOSIS"
+        ]
+        assert df["PUF_CASE_ID"].to_list() == ["CASE000001", "CASE000002"]
+        assert df["AGE"].to_list() == ["45", "67"]
+        assert df["PRIMARY_SITE"].to_list() == ["C509", "C349"]
+
+    def test_blank_fields_become_null(self, tmp_path):
+        """Test that whitespace-only fields are stripped to null."""
+        dat_file = _write_fixture(tmp_path, [
+            "CASE000001    C50 2021",
+        ])
+
+        df = read_ncdb_file(dat_file)
+
+        assert df["AGE"][0] is None
+        # Trailing padding is stripped, not kept as part of the code
+        assert df["PRIMARY_SITE"][0] == "C50"
+
+    def test_missing_labels_file(self, tmp_path):
+        """Test that a data file without a labels file is rejected."""
+        dat_file = tmp_path / "NCDBPUF_Test.dat"
+        dat_file.write_text("CASE000001 45C5092021\n")
+
+        with pytest.raises(FileNotFoundError, match="SAS labels file"):
+            read_ncdb_file(dat_file)
+
+
+class TestCreateParquetFromText:
+    """Test the .dat to parquet conversion wrapper."""
+
+    def test_converts_and_sorts_by_year(self, tmp_path, temp_output_dir):
+        """Test that conversion writes year/site-sorted parquet."""
+        dat_file = _write_fixture(tmp_path, [
+            "CASE000002 67C3492021",
+            "CASE000001 45C5092020",
+        ])
+
+        create_parquet_from_text([dat_file], temp_output_dir)
+
+        output_file = temp_output_dir / "NCDBPUF_Test.parquet"
+        assert output_file.exists()
+
+        df = pl.read_parquet(output_file)
+        assert df.height == 2
+        # Sorted for row-group pruning, so 2020 comes first
+        assert df["YEAR_OF_DIAGNOSIS"].to_list() == ["2020", "2021"]
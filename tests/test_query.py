@@ -8,8 +8,14 @@ import ncdb_tools
 from ncdb_tools.query import NCDBQuery
 
 
+@pytest.mark.xdist_group(name="ncdb_parquet")
 class TestNCDBQuery:
-    """Test the NCDBQuery class."""
+    """Test the NCDBQuery class.
+
+    Grouped for pytest-xdist so 'pytest -n auto --dist=loadgroup' keeps
+    the class on one worker, reusing that worker's memoized directory
+    listing and footer metadata across the tests.
+    """
 
     def test_load_data(self, sample_data_dir):
         """Test loading data from parquet directory."""
@@ -38,14 +44,15 @@ class TestNCDBQuery:
         assert "PUF_CASE_ID" in columns
         assert "AGE" in columns
 
-    def test_filter_by_year(self, sample_data_dir):
+    def test_filter_by_year(self, sample_data_dir, counts):
         """Test filtering by year."""
         query = ncdb_tools.load_data(sample_data_dir)
-        original_count = query.count()
+        original_lf = query.lazy_frame
 
-        # Filter by a single year
+        # Filter by a single year; both counts run in one collect_all so
+        # the parquet scan is shared between the plans
         filtered = query.filter_by_year(2021)
-        filtered_count = filtered.count()
+        original_count, filtered_count = counts(original_lf, filtered)
 
         assert filtered_count <= original_count
         assert filtered_count > 0
@@ -81,13 +88,13 @@ class TestNCDBQuery:
 
         assert count >= 0
 
-    def test_drop_missing_vital_status(self, sample_data_dir):
+    def test_drop_missing_vital_status(self, sample_data_dir, counts):
         """Test dropping missing vital status."""
         query = ncdb_tools.load_data(sample_data_dir)
-        original_count = query.count()
+        original_lf = query.lazy_frame
 
         filtered = query.drop_missing_vital_status()
-        filtered_count = filtered.count()
+        original_count, filtered_count = counts(original_lf, filtered)
 
         assert filtered_count <= original_count
 
@@ -104,6 +111,95 @@ class TestNCDBQuery:
         count = result.count()
         assert count >= 0
 
+    def test_year_pushdown_skips_partitions(self, tmp_path):
+        """Year filters on hive layouts stay visible to the planner."""
+        for year, n in ((2020, 3), (2021, 2)):
+            partition = tmp_path / f"YEAR_OF_DIAGNOSIS={year}"
+            partition.mkdir()
+            pl.DataFrame(
+                {"PUF_CASE_ID": [str(i) for i in range(n)]}
+            ).write_parquet(partition / "part-0.parquet")
+
+        query = ncdb_tools.load_data(tmp_path).filter_by_year([2021])
+
+        # The filter must survive into the optimized plan as a native
+        # predicate on the partition column so whole directories can be
+        # pruned before any file is read
+        plan = query.lazy_frame.explain()
+        assert "YEAR_OF_DIAGNOSIS" in plan
+        assert query.count() == 2
+
+    def test_filter_pushdown_reaches_scan(self, tmp_path):
+        """NCDB filters must survive as predicates inside the scan node.
+
+        A refactor that breaks predicate pushdown would silently turn
+        every filter into a post-scan pass over the full dataset; this
+        locks in the plan shape, at no runtime cost.
+        """
+        pl.DataFrame({
+            "PUF_CASE_ID": ["1", "2", "3"],
+            "YEAR_OF_DIAGNOSIS": ["2020", "2021", "2021"],
+            "PRIMARY_SITE": ["C509", "C500", "C349"],
+            "HISTOLOGY": ["8140", "8141", "8500"],
+        }).write_parquet(tmp_path / "ncdb_sample.parquet")
+
+        cases = [
+            (lambda q: q.filter_by_year([2021]), "YEAR_OF_DIAGNOSIS"),
+            (lambda q: q.filter_by_primary_site(["C509"]), "PRIMARY_SITE"),
+            (lambda q: q.filter_by_histology([8140, 8141]), "HISTOLOGY"),
+        ]
+        for apply_filter, column in cases:
+            query = apply_filter(ncdb_tools.load_data(tmp_path))
+            plan = query.lazy_frame.explain()
+
+            scan, _, selection = plan.partition("SELECTION:")
+            assert "Parquet SCAN" in scan
+            # Pushed down into the scan, as a single vectorized is_in
+            # rather than chained comparisons
+            assert column in selection
+            assert "is_in" in selection
+
+    def test_multi_file_dataset_is_one_scan(self, tmp_path):
+        """A multi-file dataset must plan as a single Parquet SCAN node.
+
+        Concatenating per-file scans instead would stop predicate and
+        projection pushdown at the concat, turning every filtered query
+        into a full scan of each file.
+        """
+        for i in range(3):
+            pl.DataFrame(
+                {"PUF_CASE_ID": [str(i)], "YEAR_OF_DIAGNOSIS": ["2021"]}
+            ).write_parquet(tmp_path / f"ncdb_part{i}.parquet")
+
+        query = ncdb_tools.load_data(tmp_path).filter_by_year([2021])
+        plan = query.lazy_frame.explain()
+
+        assert plan.count("Parquet SCAN") == 1
+        assert "SELECTION:" in plan
+
+    def test_filter_prunes_absent_site(self, tmp_path):
+        """A filter with no matches is answered from row-group statistics.
+
+        Written with statistics enabled and small row groups so the
+        engine can discard every row group from min/max ranges alone;
+        the filter must still sit inside the scan for that to happen.
+        """
+        pl.DataFrame({
+            "PUF_CASE_ID": [str(i) for i in range(8)],
+            "PRIMARY_SITE": ["C509", "C500", "C349", "C189"] * 2,
+        }).write_parquet(
+            tmp_path / "ncdb_sample.parquet",
+            statistics=True,
+            row_group_size=4,
+        )
+
+        # "ZZZZ" sorts after every real ICD-O-3 code, so no row group's
+        # min/max range can contain it
+        query = ncdb_tools.load_data(tmp_path).filter_by_primary_site(["ZZZZ"])
+
+        assert "SELECTION:" in query.lazy_frame.explain()
+        assert query.count() == 0
+
     def test_sample(self, sample_data_dir, small_sample_size):
         """Test sampling data."""
         query = ncdb_tools.load_data(sample_data_dir)
@@ -162,6 +258,20 @@ class TestNCDBQuery:
             if col in query.columns:
                 assert col in columns
 
+    def test_select_treatment(self, sample_data_dir):
+        """Test selecting treatment columns."""
+        query = ncdb_tools.load_data(sample_data_dir)
+        original_columns = query.columns
+
+        treatment_query = query.select_treatment()
+        columns = treatment_query.columns
+
+        # Should have treatment columns that exist in the data
+        expected_treatment_cols = ["RX_SUMM_SURG_PRIM_SITE", "RX_SUMM_CHEMO"]
+        for col in expected_treatment_cols:
+            if col in original_columns:
+                assert col in columns
+
     def test_select_outcomes(self, sample_data_dir):
         """Test selecting outcome columns."""
         query = ncdb_tools.load_data(sample_data_dir)
@@ -173,7 +283,25 @@ class TestNCDBQuery:
         if "PUF_VITAL_STATUS" in query.columns:
             assert "PUF_VITAL_STATUS" in columns
 
+    def test_count_fast(self, tmp_path):
+        """Test footer-based counting and its post-filter fallback."""
+        for i in range(2):
+            pl.DataFrame({
+                "PUF_CASE_ID": [str(i * 3 + j) for j in range(3)],
+                "YEAR_OF_DIAGNOSIS": ["2020", "2021", "2021"],
+            }).write_parquet(tmp_path / f"ncdb_part{i}.parquet")
+
+        # Unmodified plan: answered by summing footer num_rows; a fresh
+        # query's scan-based count() must agree
+        assert ncdb_tools.load_data(tmp_path).count_fast() == 6
+        assert ncdb_tools.load_data(tmp_path).count() == 6
+
+        # Filtered plan: footers no longer apply, falls back to count()
+        query = ncdb_tools.load_data(tmp_path).filter_by_year([2021])
+        assert query.count_fast() == query.count() == 4
 
+
+@pytest.mark.xdist_group(name="ncdb_parquet")
 class TestQueryIntegration:
     """Integration tests for query functionality."""
 
@@ -193,10 +321,19 @@ class TestQueryIntegration:
         """Test complex filtering operations."""
         query = ncdb_tools.load_data(sample_data_dir)
 
+        # AGE_AS_INT is the typed derived column (see transform.py): a
+        # native integer comparison lets parquet min/max statistics prune
+        # row groups, where a per-row cast of AGE would defeat them. Fall
+        # back to the cast on untransformed datasets.
+        if "AGE_AS_INT" in query.columns:
+            age_predicate = pl.col("AGE_AS_INT") > 50
+        else:
+            age_predicate = pl.col("AGE").cast(pl.Int64, strict=False) > 50
+
         # Complex filter combining NCDB-specific and Polars methods
         result = (query
                  .filter_by_year([2021])
-                 .filter(pl.col("AGE").cast(pl.Int64, strict=False) > 50)
+                 .filter(age_predicate)
                  .count())
 
         assert isinstance(result, int)